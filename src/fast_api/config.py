@@ -32,4 +32,9 @@ class Settings(BaseSettings):
 @lru_cache()
 def get_settings() -> Settings:
     """Get application settings (cached)."""
-    return Settings()
\ No newline at end of file
+    return Settings()
+
+
+# Eagerly built settings instance. Import this directly on hot paths to skip
+# the function call and cache lookup; get_settings() stays for Depends().
+SETTINGS: Settings = get_settings()
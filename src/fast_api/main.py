@@ -2,40 +2,39 @@
 Main FastAPI application module.
 """
 
-from collections.abc import AsyncGenerator
-from contextlib import asynccontextmanager
-
 from fastapi import FastAPI
 
-from fast_api.config import get_settings
+from fast_api.config import SETTINGS
+from fast_api.middleware import install_static_routes
+from fast_api.responses import OrjsonResponse
 from fast_api.routes import health, hello_world
 
 
-@asynccontextmanager
-async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
-    """Application lifespan context manager."""
-    # Startup
-    yield
-    # Shutdown
-
-
 def create_app() -> FastAPI:
     """Create and configure the FastAPI application."""
-    settings = get_settings()
-
     app = FastAPI(
-        title=settings.app_name,
+        title=SETTINGS.app_name,
         description="A professional FastAPI application with modern DevOps practices",
         version="0.1.0",
-        debug=settings.debug,
-        docs_url="/docs" if settings.debug else None,
-        redoc_url="/redoc" if settings.debug else None,
-        lifespan=lifespan,
+        debug=SETTINGS.debug,
+        docs_url="/docs" if SETTINGS.debug else None,
+        redoc_url="/redoc" if SETTINGS.debug else None,
+        default_response_class=OrjsonResponse,
     )
 
     # Include routers
     app.include_router(health.router, tags=["health"])
+    # Starlette accepts raw ASGI apps here, but only types request/response functions
+    app.add_route("/health/live", health.liveness_probe, methods=["GET"])  # type: ignore[arg-type]
     app.include_router(hello_world.router, tags=["Tests"])
+
+    # Serve fixed-path endpoints from a dict lookup instead of the router's
+    # regex walk.
+    install_static_routes(app)
+
+    # Build the OpenAPI schema now (it is cached on the app) so the cost is
+    # paid at startup rather than by the first /openapi.json or /docs request.
+    app.openapi()
     return app
 
 
@@ -44,13 +43,16 @@ app = create_app()
 
 
 if __name__ == "__main__":
+    import os
+
     import uvicorn
 
-    settings = get_settings()
     uvicorn.run(
         "main:app",
-        host=settings.host,
-        port=settings.port,
-        reload=settings.debug,
-        log_level=settings.log_level.lower(),
+        host=SETTINGS.host,
+        port=SETTINGS.port,
+        # reload and multiple workers are mutually exclusive
+        workers=1 if SETTINGS.debug else (os.cpu_count() or 1),
+        reload=SETTINGS.debug,
+        log_level=SETTINGS.log_level.lower(),
     )
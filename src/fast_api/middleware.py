@@ -0,0 +1,174 @@
+"""
+Static Route Dispatch
+
+Pure ASGI middleware that serves fixed-path endpoints from a dict lookup,
+bypassing Starlette's linear regex walk over the route table.
+"""
+
+import inspect
+from collections.abc import Callable, Iterable, Sequence
+from typing import Any
+
+from fastapi import FastAPI, routing
+from fastapi.datastructures import DefaultPlaceholder
+from fastapi.encoders import jsonable_encoder
+from fastapi.routing import APIRoute
+from starlette.responses import Response
+from starlette.routing import BaseRoute, Route, get_route_path
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+StaticRoutes = dict[tuple[str, str], ASGIApp]
+
+# Newer FastAPI keeps included routers nested in ``app.routes`` and exposes
+# ``iter_route_contexts`` to walk them. Each view it yields carries the
+# effective path and settings, with the route itself as ``original_route``.
+# Older releases copy included routes into ``app.routes`` directly.
+_iter_route_contexts: Callable[[Sequence[BaseRoute]], Iterable[Any]] | None = getattr(
+    routing, "iter_route_contexts", None
+)
+
+
+def _flatten(routes: Iterable[BaseRoute]) -> Iterable[Any]:
+    """Yield every route, with included routers expanded in match order."""
+    if _iter_route_contexts is None:
+        return routes
+    return _iter_route_contexts(list(routes))
+
+
+def _original(route: Any) -> BaseRoute:
+    original: BaseRoute = getattr(route, "original_route", route)
+    return original
+
+
+def _endpoint_app(route: Any) -> ASGIApp:
+    """Specialize a parameterless async endpoint into a bare ASGI app."""
+    endpoint = route.endpoint
+    response_class: Any = route.response_class
+    if isinstance(response_class, DefaultPlaceholder):
+        response_class = response_class.value
+    response_args = (
+        {} if route.status_code is None else {"status_code": route.status_code}
+    )
+
+    async def app(scope: Scope, receive: Receive, send: Send) -> None:
+        response = await endpoint()
+        if not isinstance(response, Response):
+            response = response_class(jsonable_encoder(response), **response_args)
+        await response(scope, receive, send)
+
+    return app
+
+
+def _is_static(route: Any) -> bool:
+    """Whether calling the endpoint directly is equivalent to FastAPI's handler."""
+    return (
+        route.response_model is None
+        and not route.dependant.dependencies
+        and not inspect.signature(route.endpoint).parameters
+        and inspect.iscoroutinefunction(route.endpoint)
+    )
+
+
+def _static_app(route: Any) -> ASGIApp | None:
+    """Return the ASGI app serving ``route`` if it can be dispatched directly."""
+    original = _original(route)
+    if type(original) not in (APIRoute, Route) or route.param_convertors:
+        return None
+    # Subclasses may override request handling (route_class wrappers for
+    # timing, logging, auth, ...), so only the stock route types qualify.
+    if type(original) is APIRoute:
+        return _endpoint_app(route) if _is_static(route) else None
+    # Function endpoints are wrapped by Starlette; only raw ASGI apps qualify.
+    app: ASGIApp = route.app
+    return app if app is route.endpoint else None
+
+
+def _with_route_scope(app: ASGIApp, route: BaseRoute) -> ASGIApp:
+    """Populate the scope keys the router sets before calling ``app``."""
+    endpoint = getattr(route, "endpoint", None)
+    child_scope: dict[str, Any] = {
+        "route": route,
+        "endpoint": endpoint,
+        "path_params": {},
+    }
+
+    async def handler(scope: Scope, receive: Receive, send: Send) -> None:
+        scope.update(child_scope)
+        await app(scope, receive, send)
+
+    return handler
+
+
+def _shadowed(routes: Iterable[Any], method: str, path: str) -> bool:
+    """Whether one of ``routes`` would match ``method`` and ``path`` first."""
+    for route in routes:
+        path_regex = getattr(route, "path_regex", None)
+        methods = getattr(route, "methods", None)
+        if path_regex is not None and path_regex.match(path):
+            if methods is None or method in methods:
+                return True
+    return False
+
+
+def build_static_routes(routes: Iterable[BaseRoute]) -> StaticRoutes:
+    """
+    Build the ``(method, path) -> ASGI app`` table for the fast dispatch path.
+
+    Only fixed paths on stock ``APIRoute``/``Route`` objects qualify,
+    including those reached through included routers. FastAPI routes must be
+    async endpoints without parameters, dependencies or a response model, so
+    nothing is skipped by calling them directly; plain Starlette routes
+    qualify when they wrap a raw ASGI app. A path is left to the router if an
+    earlier route would match it first.
+
+    Args:
+        routes: Application routes, in registration order
+
+    Returns:
+        Dict mapping ``(method, path)`` to the ASGI app serving it
+    """
+    table: StaticRoutes = {}
+    earlier: list[Any] = []
+    for route in _flatten(routes):
+        app = _static_app(route)
+        if app is not None:
+            app = _with_route_scope(app, _original(route))
+            for method in route.methods or ():
+                if not _shadowed(earlier, method, route.path):
+                    table.setdefault((method, route.path), app)
+        earlier.append(route)
+    return table
+
+
+class StaticRouteMiddleware:
+    """Dispatch requests for fixed paths straight to their endpoint."""
+
+    def __init__(self, app: ASGIApp, routes: StaticRoutes) -> None:
+        self.app = app
+        self.routes = routes
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http":
+            handler = self.routes.get((scope["method"], get_route_path(scope)))
+            if handler is not None:
+                await handler(scope, receive, send)
+                return
+        await self.app(scope, receive, send)
+
+
+def install_static_routes(app: FastAPI) -> None:
+    """
+    Serve the app's fixed-path endpoints through a ``StaticRouteMiddleware``.
+
+    The middleware wraps the router itself rather than being added with
+    ``app.add_middleware``, so fast-path requests still pass through
+    FastAPI's exception middleware and ``HTTPException`` and custom exception
+    handlers behave as they do on the router. Call it after all routes have
+    been registered.
+
+    Args:
+        app: Application whose router should be wrapped
+    """
+    app.router.middleware_stack = StaticRouteMiddleware(
+        app.router.middleware_stack, build_static_routes(app.routes)
+    )
@@ -5,45 +5,75 @@ Provides health check endpoints for monitoring and Kubernetes probes.
 Includes general health, readiness, and liveness probes.
 """
 
-from datetime import datetime
+import time
+from datetime import UTC, datetime
 from typing import Any
 
-from fastapi import APIRouter, Depends
-from fastapi.responses import JSONResponse
+import orjson
+from fastapi import APIRouter
+from fastapi.responses import Response
+from starlette.types import Receive, Scope, Send
 
-from ..config import Settings, get_settings
+from ..config import SETTINGS
 
 router = APIRouter()
 
+# Static parts of the probe payloads, built once at import. They are shared
+# between requests and must not be mutated by handlers.
+_APPLICATION_INFO: dict[str, Any] = {
+    "name": SETTINGS.app_name,
+    "version": SETTINGS.app_version,
+    "environment": SETTINGS.environment,
+}
+_READINESS_CHECKS: dict[str, str] = {
+    "database": "ok",  # Would be actual check result
+    "external_services": "ok",  # Would be actual check result
+}
+
+# Probe timestamps only need sub-second accuracy, so the current time is
+# cached and refreshed at most every _TS_MAX_AGE seconds.
+_TS_MAX_AGE = 0.1
+# (monotonic time of the last refresh, cached timestamp)
+_TS_CACHE: tuple[float, datetime] = (float("-inf"), datetime.now(UTC))
+
+
+def _now_utc() -> datetime:
+    """Return the current UTC time, cached for up to ``_TS_MAX_AGE`` seconds."""
+    global _TS_CACHE
+    now = time.monotonic()
+    refreshed_at, timestamp = _TS_CACHE
+    if now - refreshed_at > _TS_MAX_AGE:
+        timestamp = datetime.now(UTC)
+        _TS_CACHE = (now, timestamp)
+    return timestamp
+
 
 @router.get("/health")
-async def health_check(settings: Settings = Depends(get_settings)) -> dict[str, Any]:
+async def health_check() -> Response:
     """
     General health check endpoint.
 
     Returns basic application information and health status.
     Suitable for general monitoring and load balancer health checks.
 
-    Args:
-        settings: Application settings
-
     Returns:
-        Dict containing health status and application metadata
+        Response containing health status and application metadata
     """
-    return {
-        "status": "healthy",
-        "timestamp": datetime.utcnow().isoformat(),
-        "application": {
-            "name": settings.app_name,
-            "version": settings.app_version,
-            "environment": settings.environment,
-        },
-        "service": "fast-api",
-    }
+    # Encoding here hands the dict straight to orjson and skips FastAPI's
+    # jsonable_encoder pass as well as the response class machinery.
+    body = orjson.dumps(
+        {
+            "status": "healthy",
+            "timestamp": _now_utc(),
+            "application": _APPLICATION_INFO,
+            "service": "fast-api",
+        }
+    )
+    return Response(content=body, media_type="application/json")
 
 
 @router.get("/health/ready")
-async def readiness_probe(settings: Settings = Depends(get_settings)) -> JSONResponse:
+async def readiness_probe() -> Response:
     """
     Kubernetes readiness probe endpoint.
 
@@ -51,11 +81,8 @@ async def readiness_probe(settings: Settings = Depends(get_settings)) -> JSONRes
     This should check dependencies like databases, external services, etc.
     For this demo, we always return ready since there are no external dependencies.
 
-    Args:
-        settings: Application settings
-
     Returns:
-        JSONResponse with readiness status
+        Response with readiness status
     """
     # In a real application, you would check:
     # - Database connectivity
@@ -67,21 +94,18 @@ async def readiness_probe(settings: Settings = Depends(get_settings)) -> JSONRes
 
     response_data = {
         "status": "ready" if ready else "not_ready",
-        "timestamp": datetime.utcnow().isoformat(),
-        "checks": {
-            "database": "ok",  # Would be actual check result
-            "external_services": "ok",  # Would be actual check result
-        },
+        "timestamp": _now_utc(),
+        "checks": _READINESS_CHECKS,
     }
 
-    return JSONResponse(
+    return Response(
+        content=orjson.dumps(response_data),
         status_code=status_code,
-        content=response_data,
+        media_type="application/json",
     )
 
 
-@router.get("/health/live")
-async def liveness_probe() -> JSONResponse:
+class LivenessProbe:
     """
     Kubernetes liveness probe endpoint.
 
@@ -89,19 +113,37 @@ async def liveness_probe() -> JSONResponse:
     This should be a lightweight check that doesn't depend on external resources.
     If this fails, Kubernetes will restart the pod.
 
-    Returns:
-        JSONResponse with liveness status
+    This is the most frequently polled endpoint, so it is a raw ASGI app
+    rather than a FastAPI route: it skips dependency resolution, response
+    model handling and the JSON encoder, and writes the body directly.
+    Mount it with ``app.add_route("/health/live", liveness_probe, methods=["GET"])``.
+    It is therefore not part of the OpenAPI schema.
     """
-    # This should be a very simple check
-    # In a real application, you might check:
-    # - Application is not deadlocked
-    # - Critical threads are running
-    # - Memory usage is within limits
-
-    return JSONResponse(
-        status_code=200,
-        content={
-            "status": "alive",
-            "timestamp": datetime.utcnow().isoformat(),
-        },
-    )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        # This should be a very simple check
+        # In a real application, you might check:
+        # - Application is not deadlocked
+        # - Critical threads are running
+        # - Memory usage is within limits
+
+        body = orjson.dumps({"status": "alive", "timestamp": _now_utc()})
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 200,
+                "headers": [
+                    (b"content-type", b"application/json"),
+                    (b"content-length", str(len(body)).encode()),
+                ],
+            }
+        )
+        await send(
+            {
+                "type": "http.response.body",
+                "body": b"" if scope["method"] == "HEAD" else body,
+            }
+        )
+
+
+liveness_probe = LivenessProbe()
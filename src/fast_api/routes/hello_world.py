@@ -10,7 +10,15 @@ from fastapi import APIRouter
 
 router = APIRouter()
 
+# Static payload built once at import. Handlers return this shared object,
+# so it must never be mutated.
+_HELLO_WORLD: dict[str, Any] = {
+    "message": "Hello World!",
+    "status": "success",
+    "endpoint": "/hello-world",
+}
 
-@router.get("/hello-world")
+
+@router.get("/hello-world", response_model=None)
 def hello_world() -> dict[str, Any]:
-    return {"message": "Hello World!", "status": "success", "endpoint": "/hello-world"}
+    return _HELLO_WORLD
@@ -1,7 +1,10 @@
 """Test API endpoints."""
 
+import pytest
 from fastapi.testclient import TestClient
 
+from src.fast_api.routes import health
+
 
 # Health Check Tests
 def test_health_check(client: TestClient) -> None:
@@ -38,6 +41,24 @@ def test_liveness_check(client: TestClient) -> None:
     assert "timestamp" in data
 
 
+def test_probe_timestamp_is_cached(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that probe timestamps are reused until they are stale."""
+    clock = [1000.0]
+    monkeypatch.setattr(health.time, "monotonic", lambda: clock[0])
+    monkeypatch.setattr(
+        health, "_TS_CACHE", (float("-inf"), health.datetime.now(health.UTC))
+    )
+
+    first = health._now_utc()
+    clock[0] += health._TS_MAX_AGE / 2
+    assert health._now_utc() is first
+
+    clock[0] += health._TS_MAX_AGE
+    refreshed = health._now_utc()
+    assert refreshed is not first
+    assert refreshed >= first
+
+
 # TODO: Add your custom API tests here when you implement your endpoints
 # Example:
 # def test_your_endpoint(client: TestClient) -> None:
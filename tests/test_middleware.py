@@ -0,0 +1,230 @@
+"""Test static route dispatch."""
+
+import asyncio
+import json
+from typing import Any
+
+from fastapi import APIRouter, FastAPI, HTTPException, Request
+from fastapi.responses import JSONResponse, PlainTextResponse
+from fastapi.routing import APIRoute
+from fastapi.testclient import TestClient
+from starlette.types import Message, Receive, Scope, Send
+
+from src.fast_api.main import app
+from src.fast_api.middleware import (
+    StaticRouteMiddleware,
+    build_static_routes,
+    install_static_routes,
+)
+
+
+async def _router_sentinel(scope: Scope, receive: Receive, send: Send) -> None:
+    """Stand-in for the framework router; answers every request with 418."""
+    await PlainTextResponse("router", status_code=418)(scope, receive, send)
+
+
+def _call(
+    asgi: Any, method: str, path: str, root_path: str = ""
+) -> tuple[int, dict[str, str], bytes, Scope]:
+    """Send one HTTP request straight to an ASGI app."""
+    scope: Scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": method,
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": root_path,
+        "query_string": b"",
+        "headers": [],
+        "client": ("testclient", 50000),
+        "server": ("testserver", 80),
+    }
+    messages: list[Message] = []
+
+    async def receive() -> Message:
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message: Message) -> None:
+        messages.append(message)
+
+    asyncio.run(asgi(scope, receive, send))
+    start = messages[0]
+    headers = {k.decode(): v.decode() for k, v in start["headers"]}
+    body = b"".join(m.get("body", b"") for m in messages[1:])
+    return start["status"], headers, body, scope
+
+
+def _fast_path(routes: Any) -> StaticRouteMiddleware:
+    """Wrap the static table so that any miss is answered by the sentinel."""
+    return StaticRouteMiddleware(_router_sentinel, build_static_routes(routes))
+
+
+def _routed(routes: Any) -> FastAPI:
+    """Build an app serving ``routes`` through the router only."""
+    routed = FastAPI(openapi_url=None)
+    routed.router.routes.extend(routes)
+    return routed
+
+
+def _items_app() -> FastAPI:
+    """Build an app with parameterized, shadowed and subclassed routes."""
+    items = FastAPI()
+
+    @items.get("/items/{item_id}")
+    async def get_item(item_id: str) -> dict[str, str]:
+        return {"item": item_id}
+
+    @items.get("/items/me")
+    async def get_own_item():  # type: ignore[no-untyped-def]
+        return {"item": "static"}
+
+    @items.get("/plain")
+    async def plain():  # type: ignore[no-untyped-def]
+        return {"value": 1}
+
+    class TimedRoute(APIRoute):
+        pass
+
+    timed = APIRouter(route_class=TimedRoute)
+
+    @timed.get("/timed")
+    async def timed_endpoint():  # type: ignore[no-untyped-def]
+        return {"value": 2}
+
+    items.include_router(timed)
+    return items
+
+
+def test_static_route_table() -> None:
+    """Test that only parameterless async endpoints use the fast dispatch path."""
+    table = build_static_routes(app.routes)
+    assert ("GET", "/health") in table
+    assert ("GET", "/health/ready") in table
+    assert ("GET", "/health/live") in table
+    assert ("HEAD", "/health/live") in table
+    assert ("GET", "/hello-world") not in table
+    # The app imports fast_api.*, the tests src.fast_api.*; compare by name
+    assert type(app.router.middleware_stack).__name__ == "StaticRouteMiddleware"
+
+
+def test_included_router_prefix_is_applied() -> None:
+    """Test that routes reached through included routers use their full path."""
+    ping = FastAPI()
+    v1 = APIRouter(prefix="/v1")
+
+    @v1.get("/ping")
+    async def pong():  # type: ignore[no-untyped-def]
+        return {"ping": "pong"}
+
+    ping.include_router(v1)
+    table = build_static_routes(ping.routes)
+    assert ("GET", "/v1/ping") in table
+    assert ("GET", "/ping") not in table
+    assert _call(_fast_path(ping.routes), "GET", "/v1/ping")[0] == 200
+
+
+def test_fast_path_keeps_exception_handling() -> None:
+    """Test that HTTPException and custom handlers work on the fast path."""
+    unready = FastAPI()
+
+    class Unavailable(Exception):
+        pass
+
+    @unready.exception_handler(Unavailable)
+    async def handle_unavailable(request: Request, exc: Unavailable) -> JSONResponse:
+        return JSONResponse({"detail": "custom"}, status_code=529)
+
+    @unready.get("/ready")
+    async def ready():  # type: ignore[no-untyped-def]
+        raise HTTPException(status_code=503, detail="not ready")
+
+    @unready.get("/custom")
+    async def custom():  # type: ignore[no-untyped-def]
+        raise Unavailable()
+
+    install_static_routes(unready)
+    table = build_static_routes(unready.routes)
+    assert ("GET", "/ready") in table
+    assert ("GET", "/custom") in table
+
+    client = TestClient(unready)
+    response = client.get("/ready")
+    assert response.status_code == 503
+    assert response.json() == {"detail": "not ready"}
+    response = client.get("/custom")
+    assert response.status_code == 529
+    assert response.json() == {"detail": "custom"}
+
+
+def test_fast_path_matches_router() -> None:
+    """Test that fast-path responses match what the router returns."""
+    for path in ("/health", "/health/ready", "/health/live"):
+        fast = _call(_fast_path(app.routes), "GET", path)
+        routed = _call(_routed(app.routes), "GET", path)
+        assert fast[0] == routed[0] == 200
+        assert fast[1]["content-type"] == routed[1]["content-type"]
+        fast_data, routed_data = json.loads(fast[2]), json.loads(routed[2])
+        # Timestamps may differ across a cache refresh
+        assert fast_data.pop("timestamp") and routed_data.pop("timestamp")
+        assert fast_data == routed_data
+
+
+def test_fast_path_sets_route_scope() -> None:
+    """Test that the router's scope keys are available to the endpoint."""
+    _, _, _, scope = _call(_fast_path(app.routes), "GET", "/health")
+    assert scope["route"].path == "/health"
+    assert scope["endpoint"] is scope["route"].endpoint
+    assert scope["path_params"] == {}
+
+
+def test_fast_path_strips_root_path() -> None:
+    """Test that requests mounted under a root path still hit the fast path."""
+    status, _, body, _ = _call(
+        _fast_path(app.routes), "GET", "/api/health", root_path="/api"
+    )
+    assert status == 200
+    assert b'"healthy"' in body
+
+
+def test_head_liveness_uses_raw_asgi_app() -> None:
+    """Test that HEAD /health/live is served by the probe without a body."""
+    status, headers, body, _ = _call(_fast_path(app.routes), "HEAD", "/health/live")
+    assert status == 200
+    assert body == b""
+    get_body = _call(_fast_path(app.routes), "GET", "/health/live")[2]
+    assert int(headers["content-length"]) == len(get_body)
+
+
+def test_non_static_path_falls_through() -> None:
+    """Test that endpoints outside the static table reach the router."""
+    status, _, body, _ = _call(_fast_path(app.routes), "GET", "/hello-world")
+    assert (status, body) == (418, b"router")
+    response = TestClient(app).get("/hello-world")
+    assert response.status_code == 200
+    assert response.json()["message"] == "Hello World!"
+
+
+def test_parameterized_and_shadowed_paths_stay_on_router() -> None:
+    """Test that earlier parameterized routes keep precedence over static ones."""
+    items = _items_app()
+    table = build_static_routes(items.routes)
+    assert ("GET", "/items/me") not in table
+    assert _call(_fast_path(items.routes), "GET", "/items/me")[0] == 418
+    assert TestClient(items).get("/items/me").json() == {"item": "me"}
+
+
+def test_subclassed_route_stays_on_router() -> None:
+    """Test that custom route classes are not bypassed."""
+    items = _items_app()
+    assert ("GET", "/timed") not in build_static_routes(items.routes)
+
+
+def test_fast_path_encodes_plain_return_values() -> None:
+    """Test that non-Response return values go through the response class."""
+    items = _items_app()
+    status, headers, body, _ = _call(_fast_path(items.routes), "GET", "/plain")
+    assert status == 200
+    assert headers["content-type"] == "application/json"
+    assert body == _call(items, "GET", "/plain")[2]